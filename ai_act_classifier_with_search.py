@@ -4,10 +4,14 @@ Integrates real web search to gather information about AI systems
 """
 
 import json
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from enum import Enum
+from functools import lru_cache
 import re
+import sys
+import threading
 
 try:
     from ddgs import DDGS
@@ -15,6 +19,18 @@ try:
 except ImportError:
     SEARCH_AVAILABLE = False
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 def safe_print(msg: str):
     """Print with fallback for systems that don't support Unicode"""
     try:
@@ -30,9 +46,9 @@ class RiskLevel(Enum):
     GPAI_REQUIREMENTS = "GPAI Requirements"
     EXCEPTION = "Exception"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AISystemProfile:
-    """Structured profile of an AI system"""
+    """Structured profile of an AI system (immutable, so it can be hashed and cached)"""
     name: str
     company: str
     description: str
@@ -42,21 +58,382 @@ class AISystemProfile:
     biometrics_involved: bool
     biometrics_purpose: Optional[str]
     decision_making_role: str
-    high_risk_context: List[str]
-    data_processed: List[str]
+    high_risk_context: Tuple[str, ...]
+    data_processed: Tuple[str, ...]
     deployment_context: str
+    # Every deployment context whose keywords matched; deployment_context is the first
+    deployment_contexts: Tuple[str, ...]
     additional_info: Optional[str] = None
-    search_sources: List[str] = None
+    search_sources: Tuple[str, ...] = ()
+    # False when some search queries failed, so search_sources may be missing hits
+    search_complete: bool = True
+    # Lowercased copies used by the classifier's keyword checks
+    description_lower: str = field(init=False, repr=False, compare=False)
+    deployment_context_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen dataclass: derived fields have to bypass __setattr__
+        object.__setattr__(self, "description_lower", self.description.lower())
+        object.__setattr__(self, "deployment_context_lower", self.deployment_context.lower())
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClassificationResult:
     """Result of EU AI Act classification"""
     risk_level: RiskLevel
-    reasoning: List[str]
-    relevant_articles: List[str]
-    decision_path: List[str]
+    reasoning: Tuple[str, ...]
+    relevant_articles: Tuple[str, ...]
+    decision_path: Tuple[str, ...]
     confidence: str
-    recommendations: List[str]
+    recommendations: Tuple[str, ...]
+
+# Keyword tables used by EnhancedInformationHarvestingAgent._analyze_description.
+# Dict order matters: it breaks ties between sectors and decides which
+# decision role, deployment context and user base wins.
+# Keywords match as substrings of the lowercased text, not as whole words, so
+# "driver" also counts "drivers" and "diagnosis" counts "diagnosis-based".
+# Don't swap the scan for a token-set lookup: the tables rely on stems and plurals.
+
+# Sector identification (enhanced with more keywords)
+_SECTOR_KEYWORDS = {
+    "automotive": ["car", "vehicle", "driver", "automotive", "driving", "autonomous"],
+    "healthcare": ["health", "medical", "patient", "clinical", "diagnosis", "treatment", "hospital"],
+    "financial": ["bank", "finance", "credit", "loan", "mortgage", "payment", "insurance"],
+    "education": ["education", "student", "learning", "school", "university", "academic"],
+    "law enforcement": ["police", "law enforcement", "crime", "investigation", "surveillance"],
+    "employment": ["recruitment", "hiring", "employment", "hr", "candidate", "job"],
+    "critical infrastructure": ["infrastructure", "energy", "water", "electricity", "utility"],
+    "border control": ["border", "migration", "asylum", "immigration", "customs"],
+    "justice": ["court", "justice", "legal", "judicial", "litigation"]
+}
+
+# Biometric detection (enhanced)
+_BIOMETRIC_INDICATORS = {
+    "facial recognition": ["facial recognition", "face recognition", "face detection", "facial identification"],
+    "fingerprint": ["fingerprint", "fingerprint scan", "fingerprint recognition"],
+    "emotion recognition": ["emotion recognition", "emotion detection", "emotional state", "sentiment analysis"],
+    "voice biometric": ["voice recognition", "speaker identification", "voice biometric"],
+    "iris scan": ["iris scan", "iris recognition", "retinal scan"],
+    "gait recognition": ["gait", "walking pattern"],
+    "behavioral biometric": ["keystroke", "mouse movement", "behavioral biometric"]
+}
+
+# Biometric purpose, only consulted once biometrics are involved
+_BIOMETRIC_PURPOSES = {
+    "identification": ["identification", "identify"],
+    "emotion recognition": ["emotion", "sentiment"],
+    "categorisation": ["categorization", "categorisation"],
+    "authentication": ["verification", "authenticate"]
+}
+
+# Decision-making role (enhanced)
+_DECISION_INDICATORS = {
+    "Decision-making": ["decide", "decision", "approve", "reject", "determine", "evaluate", "assess", "score", "rate"],
+    "Assistive/Recommendatory": ["recommend", "suggest", "assist", "advise", "guide", "help"],
+    "Fully Automated Decision": ["automated decision", "automatic decision", "without human intervention"],
+    "Informational": ["inform", "display", "show", "present", "visualize"]
+}
+
+# Context labels the classifier checks for. Defined once and shared with the
+# keyword tables, so the classifier can't drift from the labels profiles carry.
+# Interning makes most comparisons an identity hit, but profiles that went
+# through pickling (e.g. Streamlit's cache) hold equal copies, not the same object
+_SAFETY_CRITICAL = sys.intern("Safety-critical environment")
+_VEHICLE_OPERATION = sys.intern("Vehicle operation")
+_MEDICAL_DECISION = sys.intern("Medical decision")
+_FINANCIAL_DECISION = sys.intern("Financial decision")
+_LAW_ENFORCEMENT = sys.intern("Law enforcement")
+_EMPLOYMENT_DECISION = sys.intern("Employment decision")
+_EDUCATIONAL_ASSESSMENT = sys.intern("Educational assessment")
+_BORDER_CONTROL = sys.intern("Border control")
+_JUSTICE_ADMINISTRATION = sys.intern("Justice administration")
+_ESSENTIAL_SERVICES = sys.intern("Essential services access")
+_CRITICAL_INFRASTRUCTURE = sys.intern("Critical infrastructure")
+_WORKPLACE = sys.intern("Workplace")
+
+# High-risk contexts (comprehensive)
+_RISK_INDICATORS = {
+    _SAFETY_CRITICAL: ["safety", "critical", "emergency", "life-threatening"],
+    _VEHICLE_OPERATION: ["vehicle", "car", "driver", "driving", "autonomous vehicle", "self-driving"],
+    _MEDICAL_DECISION: ["diagnosis", "treatment", "medical decision", "clinical decision", "patient care"],
+    _FINANCIAL_DECISION: ["credit", "loan", "financial decision", "creditworthiness", "credit score"],
+    _LAW_ENFORCEMENT: ["law enforcement", "police", "crime", "investigation", "predictive policing"],
+    _EMPLOYMENT_DECISION: ["recruitment", "hiring", "employment decision", "candidate selection", "performance evaluation"],
+    _EDUCATIONAL_ASSESSMENT: ["exam", "grade", "admission", "educational assessment", "student evaluation"],
+    _BORDER_CONTROL: ["border", "migration", "asylum", "visa", "immigration"],
+    _JUSTICE_ADMINISTRATION: ["court", "judge", "judicial", "legal proceeding", "evidence"],
+    _ESSENTIAL_SERVICES: ["public benefit", "social service", "essential service", "welfare"],
+    _CRITICAL_INFRASTRUCTURE: ["power grid", "water supply", "transportation system", "energy infrastructure"]
+}
+
+# Data types processed (enhanced)
+_DATA_INDICATORS = {
+    "Personal data": ["personal", "user data", "individual data"],
+    "Location data": ["location", "navigation", "gps", "geolocation"],
+    "Biometric data": ["biometric", "facial", "fingerprint", "iris", "voice print"],
+    "Voice/Audio data": ["voice", "speech", "audio", "conversation", "recording"],
+    "Video/Image data": ["video", "camera", "image", "photograph", "visual"],
+    "Financial data": ["financial", "transaction", "payment", "banking", "credit card"],
+    "Health data": ["health", "medical", "clinical", "patient record", "diagnosis"],
+    "Behavioral data": ["behavior", "behaviour", "pattern", "habit", "activity"],
+    "Sensitive attributes": ["race", "ethnicity", "religion", "political", "sexual orientation", "health status"]
+}
+
+# Deployment context (enhanced)
+_DEPLOYMENT_CONTEXTS = {
+    "In-vehicle system": ["vehicle", "car", "automotive", "in-car"],
+    "Healthcare facility": ["hospital", "clinic", "medical facility", "healthcare"],
+    _WORKPLACE: ["workplace", "office", "work environment", "employee"],
+    "Public space": ["public", "street", "outdoor", "public area"],
+    "Educational institution": ["school", "university", "classroom", "campus"],
+    "Border crossing": ["border", "airport", "customs", "immigration"],
+    "Law enforcement": ["police station", "law enforcement", "investigation"],
+    "Court/Legal": ["court", "courthouse", "legal proceeding"],
+    "Online service": ["online", "web", "app", "digital", "cloud"],
+    "Critical infrastructure": ["power plant", "water treatment", "infrastructure"]
+}
+
+# User base (enhanced)
+_USER_BASES = {
+    "Vehicle drivers and passengers": ["driver", "passenger", "vehicle occupant"],
+    "Patients and healthcare providers": ["patient", "doctor", "nurse", "clinician", "healthcare provider"],
+    "General consumers": ["customer", "consumer", "user", "client"],
+    "Employees and workers": ["employee", "worker", "staff", "personnel"],
+    "Students and educators": ["student", "teacher", "educator", "learner"],
+    "Law enforcement officers": ["police", "officer", "law enforcement"],
+    "Border control agents": ["border agent", "customs officer", "immigration officer"],
+    "Judges and legal professionals": ["judge", "lawyer", "attorney", "legal professional"],
+    "General public": ["public", "citizen", "resident", "population"]
+}
+
+_KEYWORD_GROUPS = {
+    "sector": _SECTOR_KEYWORDS,
+    "biometric": _BIOMETRIC_INDICATORS,
+    "biometric_purpose": _BIOMETRIC_PURPOSES,
+    "decision": _DECISION_INDICATORS,
+    "risk": _RISK_INDICATORS,
+    "data": _DATA_INDICATORS,
+    "deployment": _DEPLOYMENT_CONTEXTS,
+    "user_base": _USER_BASES
+}
+
+def _encode_keyword_groups():
+    """
+    Integer-encode the keyword tables
+    Every (group, label) pair gets a category id, contiguous per group and in
+    table order, so "first matching label" is simply the lowest matched id.
+    Every distinct keyword gets a keyword id mapped to the categories it counts for
+    """
+    labels = []
+    group_ranges = {}
+    keyword_ids = {}
+    keyword_categories = []
+    for group, table in _KEYWORD_GROUPS.items():
+        start = len(labels)
+        for label, keywords in table.items():
+            category = len(labels)
+            labels.append(label)
+            for kw in keywords:
+                if kw not in keyword_ids:
+                    keyword_ids[kw] = len(keyword_categories)
+                    keyword_categories.append([])
+                keyword_categories[keyword_ids[kw]].append(category)
+        group_ranges[group] = range(start, len(labels))
+    return (
+        tuple(labels),
+        group_ranges,
+        tuple(keyword_ids),
+        tuple(tuple(categories) for categories in keyword_categories)
+    )
+
+_CATEGORY_LABELS, _GROUP_RANGES, _KEYWORD_LIST, _KEYWORD_CATEGORIES = _encode_keyword_groups()
+
+def _build_keyword_incidence():
+    """(n_keywords, n_categories) 0/1 matrix used by _score_categories_batch"""
+    incidence = np.zeros((len(_KEYWORD_LIST), len(_CATEGORY_LABELS)), dtype=np.float32)
+    for kw_id, categories in enumerate(_KEYWORD_CATEGORIES):
+        incidence[kw_id, list(categories)] = 1
+    return incidence
+
+if NUMPY_AVAILABLE:
+    _KEYWORD_INCIDENCE = _build_keyword_incidence()
+
+def _compile_keyword_scan() -> Callable[[str], List[int]]:
+    """
+    Fallback matcher for when pyahocorasick is missing
+    Generates one function with every keyword inlined as a string constant
+    (`if "car" in text: found.append(0)`). Partially evaluating the scan against
+    the fixed tables drops the per-keyword loop, about a third of the cost on
+    short texts; CPython's substring search does the rest
+    """
+    lines = ["def scan(text):", "    found = []"]
+    for kw_id, kw in enumerate(_KEYWORD_LIST):
+        lines.append(f"    if {kw!r} in text: found.append({kw_id})")
+    lines.append("    return found")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["scan"]
+
+def _build_keyword_matcher() -> Callable[[str], Iterable[int]]:
+    """Return a function yielding the ids of the keywords found in a lowercased text"""
+    if not AHOCORASICK_AVAILABLE:
+        return _compile_keyword_scan()
+
+    # One linear Aho-Corasick pass, with the keyword id as the match payload
+    automaton = ahocorasick.Automaton()
+    for kw_id, kw in enumerate(_KEYWORD_LIST):
+        automaton.add_word(kw, kw_id)
+    automaton.make_automaton()
+    return lambda text: (kw_id for _, kw_id in automaton.iter(text))
+
+_match_keyword_ids = _build_keyword_matcher()
+
+def _score_categories(match_ids: Iterable[int]) -> List[int]:
+    """Count distinct matched keywords per category id"""
+    counts = [0] * len(_CATEGORY_LABELS)
+    for kw_id in set(match_ids):
+        for category in _KEYWORD_CATEGORIES[kw_id]:
+            counts[category] += 1
+    return counts
+
+def _first_label(counts: List[int], group: str, default: Optional[str]) -> Optional[str]:
+    """Label of the first category in table order with any match"""
+    for category in _GROUP_RANGES[group]:
+        if counts[category]:
+            return _CATEGORY_LABELS[category]
+    return default
+
+def _matched_labels(counts: List[int], group: str) -> List[str]:
+    """Labels of every category with a match, in table order"""
+    return [_CATEGORY_LABELS[category] for category in _GROUP_RANGES[group] if counts[category]]
+
+# Verbs that mark a sentence as describing what the system does
+_PURPOSE_TRIGGERS = ("uses", "enables", "provides", "helps")
+
+# A sentence is a run of text between full stops. Iterating matches instead of
+# str.split(".") stops at the first hit without splitting the whole text, which
+# matters once search results are appended. Length limits stay in Python: they
+# apply after stripping, and a bounded repeat here would match inside long sentences
+_SENTENCE_RE = re.compile(r"[^.]+")
+
+def _extract_primary_purpose(text: str, name: str) -> str:
+    """Extract the primary purpose from text"""
+    # Try to find sentences containing the system name or a purpose verb
+    name_lower = name.lower()
+    for match in _SENTENCE_RE.finditer(text):
+        sentence = match.group()
+        cleaned = sentence.strip()
+        # Length check first: it is cheaper than lowercasing and scanning
+        if not 20 < len(cleaned) < 200:
+            continue
+        sentence_lower = sentence.lower()
+        if name_lower in sentence_lower or any(word in sentence_lower for word in _PURPOSE_TRIGGERS):
+            return cleaned
+    
+    # Fallback: return first substantial sentence
+    for match in _SENTENCE_RE.finditer(text):
+        cleaned = match.group().strip()
+        if len(cleaned) > 30:
+            return cleaned[:150]
+    
+    return text[:150]
+
+def _indicators_from_counts(counts: List[int], full_text: str, name: str) -> Dict:
+    """Turn the category counts of an analysed text into regulatory indicators"""
+    # Sector identification: most distinct keyword matches wins
+    sector = "General"
+    sector_confidence = 0
+    for category in _GROUP_RANGES["sector"]:
+        if counts[category] > sector_confidence:
+            sector_confidence = counts[category]
+            sector = _CATEGORY_LABELS[category].title()
+    
+    # Biometric detection; the purpose is only looked for once biometrics are involved
+    biometrics_involved = bool(_matched_labels(counts, "biometric"))
+    biometrics_purpose = _first_label(counts, "biometric_purpose", None) if biometrics_involved else None
+    
+    return {
+        "sector": sector,
+        "primary_purpose": _extract_primary_purpose(full_text, name),
+        "user_base": _first_label(counts, "user_base", "General public"),
+        "biometrics_involved": biometrics_involved,
+        "biometrics_purpose": biometrics_purpose,
+        "decision_making_role": _first_label(counts, "decision", "Informational"),
+        "high_risk_contexts": _matched_labels(counts, "risk"),
+        "data_processed": _matched_labels(counts, "data"),
+        "deployment_context": _first_label(counts, "deployment", "General commercial use"),
+        "deployment_contexts": _matched_labels(counts, "deployment")
+    }
+
+def _score_categories_batch(texts_lower: List[str]) -> List[List[int]]:
+    """
+    Category counts (as from _score_categories) for each of a batch of lowercased texts
+    The automaton is already linear per text, so it is used whenever available.
+    Otherwise NumPy runs one vectorized substring search per keyword over the
+    whole batch, and the resulting (n_texts, n_keywords) presence matrix times
+    the keyword incidence matrix yields every text's counts in one product
+    """
+    if AHOCORASICK_AVAILABLE or not NUMPY_AVAILABLE or not texts_lower:
+        return [_score_categories(_match_keyword_ids(text)) for text in texts_lower]
+
+    texts = np.array(texts_lower, dtype=str)
+    present = np.stack([np.char.find(texts, kw) >= 0 for kw in _KEYWORD_LIST], axis=1)
+
+    # float32 goes through BLAS (integer matmul doesn't) and is exact for counts this small
+    counts = (present.astype(np.float32) @ _KEYWORD_INCIDENCE).astype(np.int32)
+    return counts.tolist()
+
+def _run_search_query(query: str) -> Optional[List[Dict]]:
+    """Run a single search query in its own DDGS session; None if it failed"""
+    try:
+        with DDGS() as ddgs:
+            return list(ddgs.text(query, max_results=3))
+    except Exception as e:
+        safe_print(f"   [WARN] Search query failed: {e}")
+        return None
+
+class _PartialSearchResults(Exception):
+    """Raised out of the search cache when some queries failed; carries the hits that did arrive"""
+
+    def __init__(self, hits: Tuple[Tuple[str, str, str], ...]):
+        super().__init__("some search queries failed")
+        self.hits = hits
+
+@lru_cache(maxsize=512)
+def _fetch_search(name: str, company: str) -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Search the web for a system and return deduplicated (title, snippet, url) hits
+    Cached per (name, company) for the lifetime of the process. Only complete results
+    are cached: a failed query (e.g. a rate limit) raises, with any partial hits attached
+    as _PartialSearchResults, so it is retried on the next call
+    """
+    search_queries = [
+        f"{company} {name} AI system",
+        f"{company} {name} use case application",
+    ]
+
+    # Queries are network-bound, so run them side by side. Each worker
+    # opens its own DDGS session; a single session isn't thread-safe
+    with ThreadPoolExecutor(max_workers=len(search_queries)) as executor:
+        query_results = list(executor.map(_run_search_query, search_queries))
+
+    if all(results is None for results in query_results):
+        raise RuntimeError("all search queries failed")
+
+    hits = []
+    sources_seen = set()
+
+    for results in query_results:
+        for result in results or ():
+            # Avoid duplicates based on URL
+            if result.get('href') not in sources_seen:
+                url = result.get('href', '')
+                hits.append((result.get('title', ''), result.get('body', ''), url))
+                sources_seen.add(url)
+
+    if None in query_results:
+        raise _PartialSearchResults(tuple(hits))
+
+    return tuple(hits)
 
 class EnhancedInformationHarvestingAgent:
     """
@@ -82,10 +459,11 @@ class EnhancedInformationHarvestingAgent:
         # Step 1: Perform web searches
         search_info = ""
         sources = []
+        search_complete = True
         
         if self.enable_search:
             safe_print(f"\n   Searching the web for additional context...")
-            search_info, sources = self._search_for_system(name, company, description)
+            search_info, sources, search_complete = self._search_for_system(name, company, description)
 
         # Step 2: Analyze all available information
         combined_info = f"{description}\n\nAdditional Context from Web Search:\n{search_info}"
@@ -94,8 +472,51 @@ class EnhancedInformationHarvestingAgent:
         safe_print(f"   [OK] Analyzing system characteristics...")
 
         analysis = self._analyze_description(combined_info, name, company)
+        profile = self._build_profile(name, company, description, analysis, search_info, sources,
+                                      search_complete)
+
+        safe_print(f"   [OK] Profile complete!")
+        
+        return profile
+
+    def harvest_batch(self, items: Iterable[Tuple[str, str, str]]) -> List[AISystemProfile]:
+        """
+        Harvest profiles for many (name, company, description) tuples at once
+        Keyword scoring for the whole batch runs up front (see _score_categories_batch)
+        """
+        items = list(items)
+        safe_print(f"\n[SEARCH] Stage 1: Harvesting information for {len(items)} systems")
+
+        searches = []
+        for name, company, description in items:
+            if self.enable_search:
+                searches.append(self._search_for_system(name, company, description))
+            else:
+                searches.append(("", [], True))
+
+        texts = [
+            f"{description}\n\nAdditional Context from Web Search:\n{search_info}"
+            for (_, _, description), (search_info, _, _) in zip(items, searches)
+        ]
+        texts_lower = [text.lower() for text in texts]
+        batch_counts = _score_categories_batch(texts_lower)
+
+        profiles = []
+        for (name, company, description), (search_info, sources, search_complete), text, counts in zip(
+            items, searches, texts, batch_counts
+        ):
+            analysis = _indicators_from_counts(counts, text, name)
+            profiles.append(self._build_profile(name, company, description, analysis, search_info, sources,
+                                                search_complete))
+
+        safe_print(f"   [OK] {len(profiles)} profiles complete!")
+
+        return profiles
 
-        profile = AISystemProfile(
+    def _build_profile(self, name: str, company: str, description: str, analysis: Dict,
+                       search_info: str, sources: List[str], search_complete: bool = True) -> AISystemProfile:
+        """Assemble a profile from the analysis of a system's description"""
+        return AISystemProfile(
             name=name,
             company=company,
             description=description,
@@ -105,56 +526,40 @@ class EnhancedInformationHarvestingAgent:
             biometrics_involved=analysis["biometrics_involved"],
             biometrics_purpose=analysis["biometrics_purpose"],
             decision_making_role=analysis["decision_making_role"],
-            high_risk_context=analysis["high_risk_contexts"],
-            data_processed=analysis["data_processed"],
+            high_risk_context=tuple(analysis["high_risk_contexts"]),
+            data_processed=tuple(analysis["data_processed"]),
             deployment_context=analysis["deployment_context"],
+            deployment_contexts=tuple(analysis["deployment_contexts"]),
             additional_info=search_info if search_info else None,
-            search_sources=sources
+            search_sources=tuple(sources),
+            search_complete=search_complete
         )
-
-        safe_print(f"   [OK] Profile complete!")
-        
-        return profile
     
-    def _search_for_system(self, name: str, company: str, description: str) -> Tuple[str, List[str]]:
+    def _search_for_system(self, name: str, company: str, description: str) -> Tuple[str, List[str], bool]:
         """
         Perform web searches to gather additional context
         Uses DuckDuckGo search API (free, no API key required)
+        Returns the formatted results, their sources and whether every query succeeded
         """
         if not SEARCH_AVAILABLE:
             safe_print("   [WARN] Web search not available (ddgs not installed)")
-            return "", []
-
-        search_queries = [
-            f"{company} {name} AI system",
-            f"{company} {name} use case application",
-        ]
-
-        all_results = []
-        sources = []
+            return "", [], True
 
+        complete = True
         try:
-            with DDGS() as ddgs:
-                for query in search_queries:
-                    try:
-                        results = list(ddgs.text(query, max_results=3))
-                        for result in results:
-                            # Avoid duplicates based on URL
-                            if result.get('href') not in sources:
-                                all_results.append({
-                                    'title': result.get('title', ''),
-                                    'snippet': result.get('body', ''),
-                                    'url': result.get('href', '')
-                                })
-                                sources.append(result.get('href', ''))
-                    except Exception as e:
-                        safe_print(f"   [WARN] Search query failed: {e}")
-                        continue
+            hits = _fetch_search(name, company)
+        except _PartialSearchResults as e:
+            # Served uncached, so the failed queries are retried next time
+            hits = e.hits
+            complete = False
         except Exception as e:
             safe_print(f"   [WARN] Web search error: {e}")
-            return "", []
+            return "", [], False
+
+        all_results = [{'title': title, 'snippet': snippet, 'url': url} for title, snippet, url in hits]
+        sources = [url for _, _, url in hits]
 
-        return self._format_search_results(all_results), sources
+        return self._format_search_results(all_results), sources, complete
     
     def _format_search_results(self, results: List[Dict]) -> str:
         """Format search results into readable text for analysis"""
@@ -175,181 +580,17 @@ class EnhancedInformationHarvestingAgent:
         Analyze the combined description and search results
         Extract key regulatory indicators
         """
-        text_lower = full_text.lower()
-        
-        # Sector identification (enhanced with more keywords)
-        sector_keywords = {
-            "automotive": ["car", "vehicle", "driver", "automotive", "driving", "autonomous"],
-            "healthcare": ["health", "medical", "patient", "clinical", "diagnosis", "treatment", "hospital"],
-            "financial": ["bank", "finance", "credit", "loan", "mortgage", "payment", "insurance"],
-            "education": ["education", "student", "learning", "school", "university", "academic"],
-            "law enforcement": ["police", "law enforcement", "crime", "investigation", "surveillance"],
-            "employment": ["recruitment", "hiring", "employment", "hr", "candidate", "job"],
-            "critical infrastructure": ["infrastructure", "energy", "water", "electricity", "utility"],
-            "border control": ["border", "migration", "asylum", "immigration", "customs"],
-            "justice": ["court", "justice", "legal", "judicial", "litigation"]
-        }
-        
-        sector = "General"
-        sector_confidence = 0
-        for sec, keywords in sector_keywords.items():
-            matches = sum(1 for kw in keywords if kw in text_lower)
-            if matches > sector_confidence:
-                sector_confidence = matches
-                sector = sec.title()
-        
-        # Biometric detection (enhanced)
-        biometric_indicators = {
-            "facial recognition": ["facial recognition", "face recognition", "face detection", "facial identification"],
-            "fingerprint": ["fingerprint", "fingerprint scan", "fingerprint recognition"],
-            "emotion recognition": ["emotion recognition", "emotion detection", "emotional state", "sentiment analysis"],
-            "voice biometric": ["voice recognition", "speaker identification", "voice biometric"],
-            "iris scan": ["iris scan", "iris recognition", "retinal scan"],
-            "gait recognition": ["gait", "walking pattern"],
-            "behavioral biometric": ["keystroke", "mouse movement", "behavioral biometric"]
-        }
-        
-        biometrics_involved = False
-        biometrics_purpose = None
-        
-        for bio_type, keywords in biometric_indicators.items():
-            if any(kw in text_lower for kw in keywords):
-                biometrics_involved = True
-                
-                # Determine purpose
-                if "identification" in text_lower or "identify" in text_lower:
-                    biometrics_purpose = "identification"
-                elif "emotion" in text_lower or "sentiment" in text_lower:
-                    biometrics_purpose = "emotion recognition"
-                elif "categorization" in text_lower or "categorisation" in text_lower:
-                    biometrics_purpose = "categorisation"
-                elif "verification" in text_lower or "authenticate" in text_lower:
-                    biometrics_purpose = "authentication"
-                break
-        
-        # Decision-making role (enhanced)
-        decision_indicators = {
-            "Decision-making": ["decide", "decision", "approve", "reject", "determine", "evaluate", "assess", "score", "rate"],
-            "Assistive/Recommendatory": ["recommend", "suggest", "assist", "advise", "guide", "help"],
-            "Fully Automated Decision": ["automated decision", "automatic decision", "without human intervention"],
-            "Informational": ["inform", "display", "show", "present", "visualize"]
-        }
-        
-        decision_making_role = "Informational"
-        for role, keywords in decision_indicators.items():
-            if any(kw in text_lower for kw in keywords):
-                decision_making_role = role
-                break
-        
-        # High-risk contexts (comprehensive)
-        high_risk_contexts = []
-        risk_indicators = {
-            "Safety-critical environment": ["safety", "critical", "emergency", "life-threatening"],
-            "Vehicle operation": ["vehicle", "car", "driver", "driving", "autonomous vehicle", "self-driving"],
-            "Medical decision": ["diagnosis", "treatment", "medical decision", "clinical decision", "patient care"],
-            "Financial decision": ["credit", "loan", "financial decision", "creditworthiness", "credit score"],
-            "Law enforcement": ["law enforcement", "police", "crime", "investigation", "predictive policing"],
-            "Employment decision": ["recruitment", "hiring", "employment decision", "candidate selection", "performance evaluation"],
-            "Educational assessment": ["exam", "grade", "admission", "educational assessment", "student evaluation"],
-            "Border control": ["border", "migration", "asylum", "visa", "immigration"],
-            "Justice administration": ["court", "judge", "judicial", "legal proceeding", "evidence"],
-            "Essential services access": ["public benefit", "social service", "essential service", "welfare"],
-            "Critical infrastructure": ["power grid", "water supply", "transportation system", "energy infrastructure"]
-        }
-        
-        for context, keywords in risk_indicators.items():
-            if any(kw in text_lower for kw in keywords):
-                high_risk_contexts.append(context)
-        
-        # Data types processed (enhanced)
-        data_types = []
-        data_indicators = {
-            "Personal data": ["personal", "user data", "individual data"],
-            "Location data": ["location", "navigation", "gps", "geolocation"],
-            "Biometric data": ["biometric", "facial", "fingerprint", "iris", "voice print"],
-            "Voice/Audio data": ["voice", "speech", "audio", "conversation", "recording"],
-            "Video/Image data": ["video", "camera", "image", "photograph", "visual"],
-            "Financial data": ["financial", "transaction", "payment", "banking", "credit card"],
-            "Health data": ["health", "medical", "clinical", "patient record", "diagnosis"],
-            "Behavioral data": ["behavior", "behaviour", "pattern", "habit", "activity"],
-            "Sensitive attributes": ["race", "ethnicity", "religion", "political", "sexual orientation", "health status"]
-        }
-        
-        for data_type, keywords in data_indicators.items():
-            if any(kw in text_lower for kw in keywords):
-                data_types.append(data_type)
-        
-        # Deployment context (enhanced)
-        deployment_contexts = {
-            "In-vehicle system": ["vehicle", "car", "automotive", "in-car"],
-            "Healthcare facility": ["hospital", "clinic", "medical facility", "healthcare"],
-            "Workplace": ["workplace", "office", "work environment", "employee"],
-            "Public space": ["public", "street", "outdoor", "public area"],
-            "Educational institution": ["school", "university", "classroom", "campus"],
-            "Border crossing": ["border", "airport", "customs", "immigration"],
-            "Law enforcement": ["police station", "law enforcement", "investigation"],
-            "Court/Legal": ["court", "courthouse", "legal proceeding"],
-            "Online service": ["online", "web", "app", "digital", "cloud"],
-            "Critical infrastructure": ["power plant", "water treatment", "infrastructure"]
-        }
-        
-        deployment_context = "General commercial use"
-        for context, keywords in deployment_contexts.items():
-            if any(kw in text_lower for kw in keywords):
-                deployment_context = context
-                break
-        
-        # User base (enhanced)
-        user_bases = {
-            "Vehicle drivers and passengers": ["driver", "passenger", "vehicle occupant"],
-            "Patients and healthcare providers": ["patient", "doctor", "nurse", "clinician", "healthcare provider"],
-            "General consumers": ["customer", "consumer", "user", "client"],
-            "Employees and workers": ["employee", "worker", "staff", "personnel"],
-            "Students and educators": ["student", "teacher", "educator", "learner"],
-            "Law enforcement officers": ["police", "officer", "law enforcement"],
-            "Border control agents": ["border agent", "customs officer", "immigration officer"],
-            "Judges and legal professionals": ["judge", "lawyer", "attorney", "legal professional"],
-            "General public": ["public", "citizen", "resident", "population"]
-        }
-        
-        user_base = "General public"
-        for base, keywords in user_bases.items():
-            if any(kw in text_lower for kw in keywords):
-                user_base = base
-                break
-        
-        # Extract primary purpose
-        primary_purpose = self._extract_primary_purpose(full_text, name)
-        
-        return {
-            "sector": sector,
-            "primary_purpose": primary_purpose,
-            "user_base": user_base,
-            "biometrics_involved": biometrics_involved,
-            "biometrics_purpose": biometrics_purpose,
-            "decision_making_role": decision_making_role,
-            "high_risk_contexts": high_risk_contexts,
-            "data_processed": data_types,
-            "deployment_context": deployment_context
-        }
-    
-    def _extract_primary_purpose(self, text: str, name: str) -> str:
-        """Extract the primary purpose from text"""
-        # Try to find sentences containing the system name
-        sentences = text.split(".")
-        for sentence in sentences:
-            if name.lower() in sentence.lower() or any(word in sentence.lower() for word in ["uses", "enables", "provides", "helps"]):
-                cleaned = sentence.strip()
-                if len(cleaned) > 20 and len(cleaned) < 200:
-                    return cleaned
-        
-        # Fallback: return first substantial sentence
-        for sentence in sentences:
-            cleaned = sentence.strip()
-            if len(cleaned) > 30:
-                return cleaned[:150]
-        
-        return text[:150]
+        counts = _score_categories(_match_keyword_ids(full_text.lower()))
+        return _indicators_from_counts(counts, full_text, name)
+
+# Relevant provisions cited for each risk level
+_ARTICLES = {
+    RiskLevel.PROHIBITED: ("Article 5 - Prohibited Practices",),
+    RiskLevel.HIGH_RISK: ("Article 6 & Annex III", "Articles 8-15 - Requirements"),
+    RiskLevel.TRANSPARENCY_REQUIREMENTS: ("Article 50 - Transparency",),
+    RiskLevel.LOW_RISK: ("Article 69 - Codes of Conduct (voluntary)",),
+    RiskLevel.EXCEPTION: ("Article 2 - Scope exceptions",)
+}
 
 # Import the existing RiskClassificationAgent
 class RiskClassificationAgent:
@@ -359,9 +600,16 @@ class RiskClassificationAgent:
         self.decision_path = []
         self.reasoning = []
         self.recommendations = []
+        # classify() builds its result in the lists above, so concurrent calls
+        # on a shared instance (the Streamlit app caches one) take turns
+        self._lock = threading.Lock()
         
     def classify(self, profile: AISystemProfile) -> ClassificationResult:
         """Apply EU AI Act flowchart logic"""
+        with self._lock:
+            return self._classify(profile)
+
+    def _classify(self, profile: AISystemProfile) -> ClassificationResult:
         safe_print(f"\n[CLASSIFY] Stage 2: Applying EU AI Act Classification Logic")
         
         self.decision_path = []
@@ -391,12 +639,12 @@ class RiskClassificationAgent:
         self.decision_path.append("Article 2: Scope exceptions")
         
         # Scientific research
-        if "research" in profile.description.lower() and "scientific" in profile.description.lower():
+        if "research" in profile.description_lower and "scientific" in profile.description_lower:
             self.reasoning.append("May qualify for scientific research exception (Article 2.6)")
             return True
         
         # Military/defense
-        if any(word in profile.description.lower() for word in ["military", "defence", "defense"]):
+        if any(word in profile.description_lower for word in ["military", "defence", "defense"]):
             self.reasoning.append("Military/defence exception applies (Article 2.3)")
             return True
         
@@ -407,25 +655,26 @@ class RiskClassificationAgent:
         self.decision_path.append("Article 5: Prohibited AI practices")
         
         # Subliminal manipulation
-        if any(word in profile.description.lower() for word in ["manipulate", "subliminal", "exploit vulnerabilities"]):
+        if any(word in profile.description_lower for word in ["manipulate", "subliminal", "exploit vulnerabilities"]):
             self.reasoning.append("🚫 PROHIBITED: Subliminal manipulation (Article 5.1a)")
             return True
         
         # Social scoring
-        if "social scor" in profile.description.lower():
+        if "social scor" in profile.description_lower:
             self.reasoning.append("🚫 PROHIBITED: Social scoring system (Article 5.1c)")
             return True
         
         # Real-time remote biometric identification
         if profile.biometrics_involved and profile.biometrics_purpose == "identification":
-            if "real-time" in profile.description.lower() or "live" in profile.description.lower():
-                if "public" in profile.deployment_context.lower():
+            if "real-time" in profile.description_lower or "live" in profile.description_lower:
+                if "public" in profile.deployment_context_lower:
                     self.reasoning.append("🚫 PROHIBITED: Real-time remote biometric identification (Article 5.1h)")
                     return True
         
         # Emotion recognition in workplace/education
         if profile.biometrics_purpose == "emotion recognition":
-            if any(ctx in profile.high_risk_context for ctx in ["Workplace", "Educational assessment"]):
+            # Workplace is a deployment context; any workplace keyword counts, not just the first match
+            if _WORKPLACE in profile.deployment_contexts or _EDUCATIONAL_ASSESSMENT in profile.high_risk_context:
                 self.reasoning.append("🚫 PROHIBITED: Emotion recognition in workplace/education (Article 5.1f)")
                 return True
         
@@ -442,49 +691,49 @@ class RiskClassificationAgent:
             return True
         
         # Critical infrastructure & safety (Annex III.2)
-        if "Critical infrastructure" in profile.high_risk_context:
+        if _CRITICAL_INFRASTRUCTURE in profile.high_risk_context:
             self.reasoning.append("⚠️ HIGH-RISK: Critical infrastructure system (Annex III.2)")
             self._add_high_risk_recommendations("infrastructure")
             return True
         
-        if "Safety-critical environment" in profile.high_risk_context or "Vehicle operation" in profile.high_risk_context:
+        if _SAFETY_CRITICAL in profile.high_risk_context or _VEHICLE_OPERATION in profile.high_risk_context:
             self.reasoning.append("⚠️ HIGH-RISK: Safety component in vehicle operation (Annex III.2)")
             self.reasoning.append("System operates in safety-critical context")
             self._add_high_risk_recommendations("safety")
             return True
         
         # Education (Annex III.3)
-        if "Educational assessment" in profile.high_risk_context:
+        if _EDUCATIONAL_ASSESSMENT in profile.high_risk_context:
             self.reasoning.append("⚠️ HIGH-RISK: Educational assessment system (Annex III.3)")
             self._add_high_risk_recommendations("education")
             return True
         
         # Employment (Annex III.4)
-        if "Employment decision" in profile.high_risk_context:
+        if _EMPLOYMENT_DECISION in profile.high_risk_context:
             self.reasoning.append("⚠️ HIGH-RISK: Employment decision system (Annex III.4)")
             self._add_high_risk_recommendations("employment")
             return True
         
         # Essential services (Annex III.5)
-        if "Essential services access" in profile.high_risk_context or "Financial decision" in profile.high_risk_context:
+        if _ESSENTIAL_SERVICES in profile.high_risk_context or _FINANCIAL_DECISION in profile.high_risk_context:
             self.reasoning.append("⚠️ HIGH-RISK: Essential services/creditworthiness (Annex III.5)")
             self._add_high_risk_recommendations("essential_services")
             return True
         
         # Law enforcement (Annex III.6)
-        if "Law enforcement" in profile.high_risk_context:
+        if _LAW_ENFORCEMENT in profile.high_risk_context:
             self.reasoning.append("⚠️ HIGH-RISK: Law enforcement application (Annex III.6)")
             self._add_high_risk_recommendations("law_enforcement")
             return True
         
         # Border control (Annex III.7)
-        if "Border control" in profile.high_risk_context:
+        if _BORDER_CONTROL in profile.high_risk_context:
             self.reasoning.append("⚠️ HIGH-RISK: Border control system (Annex III.7)")
             self._add_high_risk_recommendations("border_control")
             return True
         
         # Justice (Annex III.8)
-        if "Justice administration" in profile.high_risk_context:
+        if _JUSTICE_ADMINISTRATION in profile.high_risk_context:
             self.reasoning.append("⚠️ HIGH-RISK: Administration of justice (Annex III.8)")
             self._add_high_risk_recommendations("justice")
             return True
@@ -496,13 +745,13 @@ class RiskClassificationAgent:
         self.decision_path.append("Article 50: Transparency requirements")
         
         # Interactive AI
-        if any(word in profile.description.lower() for word in ["chat", "conversational", "assistant", "interact"]):
+        if any(word in profile.description_lower for word in ["chat", "conversational", "assistant", "interact"]):
             self.reasoning.append("ℹ️ TRANSPARENCY: Interactive AI system (Article 50.1)")
             self.recommendations.append("Disclose AI interaction to users")
             return True
         
         # Generative AI
-        if "generat" in profile.description.lower():
+        if "generat" in profile.description_lower:
             self.reasoning.append("ℹ️ TRANSPARENCY: Generative AI system (Article 50.2)")
             self.recommendations.append("Label AI-generated content")
             return True
@@ -535,85 +784,79 @@ class RiskClassificationAgent:
     
     def _create_result(self, risk_level: RiskLevel) -> ClassificationResult:
         """Create final result"""
-        articles = {
-            RiskLevel.PROHIBITED: ["Article 5 - Prohibited Practices"],
-            RiskLevel.HIGH_RISK: ["Article 6 & Annex III", "Articles 8-15 - Requirements"],
-            RiskLevel.TRANSPARENCY_REQUIREMENTS: ["Article 50 - Transparency"],
-            RiskLevel.LOW_RISK: ["Article 69 - Codes of Conduct (voluntary)"],
-            RiskLevel.EXCEPTION: ["Article 2 - Scope exceptions"]
-        }
-        
         confidence = "High" if len(self.reasoning) >= 3 else "Medium" if len(self.reasoning) >= 2 else "Low"
         
         return ClassificationResult(
             risk_level=risk_level,
-            reasoning=self.reasoning if self.reasoning else ["No specific risks identified"],
-            relevant_articles=articles.get(risk_level, []),
-            decision_path=self.decision_path,
+            reasoning=tuple(self.reasoning) if self.reasoning else ("No specific risks identified",),
+            relevant_articles=_ARTICLES.get(risk_level, ()),
+            decision_path=tuple(self.decision_path),
             confidence=confidence,
-            recommendations=self.recommendations if self.recommendations else ["Monitor regulatory developments"]
+            recommendations=tuple(self.recommendations) if self.recommendations else ("Monitor regulatory developments",)
         )
 
-def format_result(profile: AISystemProfile, result: ClassificationResult) -> str:
-    """Format results for display"""
-    output = []
-    output.append("\n" + "="*100)
-    output.append("EU AI ACT CLASSIFICATION REPORT")
-    output.append("="*100)
+# Report icon for each risk level
+_RISK_LEVEL_INDICATORS = {
+    RiskLevel.PROHIBITED: "🚫",
+    RiskLevel.HIGH_RISK: "⚠️",
+    RiskLevel.TRANSPARENCY_REQUIREMENTS: "ℹ️",
+    RiskLevel.LOW_RISK: "✅",
+    RiskLevel.EXCEPTION: "➖"
+}
+
+def iter_result_lines(profile: AISystemProfile, result: ClassificationResult) -> Iterator[str]:
+    """Yield the lines of the classification report one at a time"""
+    yield "\n" + "="*100
+    yield "EU AI ACT CLASSIFICATION REPORT"
+    yield "="*100
     
     # Profile section
-    output.append("\n📋 SYSTEM PROFILE")
-    output.append("─"*100)
-    output.append(f"  Name: {profile.name}")
-    output.append(f"  Company: {profile.company}")
-    output.append(f"  Sector: {profile.sector}")
-    output.append(f"  Deployment: {profile.deployment_context}")
-    output.append(f"  User Base: {profile.user_base}")
-    output.append(f"  Decision Role: {profile.decision_making_role}")
+    yield "\n📋 SYSTEM PROFILE"
+    yield "─"*100
+    yield f"  Name: {profile.name}"
+    yield f"  Company: {profile.company}"
+    yield f"  Sector: {profile.sector}"
+    yield f"  Deployment: {profile.deployment_context}"
+    yield f"  User Base: {profile.user_base}"
+    yield f"  Decision Role: {profile.decision_making_role}"
     
     if profile.biometrics_involved:
-        output.append(f"\n  🔐 Biometrics: Yes ({profile.biometrics_purpose})")
+        yield f"\n  🔐 Biometrics: Yes ({profile.biometrics_purpose})"
     
     if profile.high_risk_context:
-        output.append("\n  ⚠️  High-Risk Contexts:")
+        yield "\n  ⚠️  High-Risk Contexts:"
         for ctx in profile.high_risk_context:
-            output.append(f"     • {ctx}")
+            yield f"     • {ctx}"
     
     if profile.search_sources:
-        output.append(f"\n  📚 Sources: {len(profile.search_sources)} web sources consulted")
+        yield f"\n  📚 Sources: {len(profile.search_sources)} web sources consulted"
     
     # Classification section
-    indicators = {
-        RiskLevel.PROHIBITED: "🚫",
-        RiskLevel.HIGH_RISK: "⚠️",
-        RiskLevel.TRANSPARENCY_REQUIREMENTS: "ℹ️",
-        RiskLevel.LOW_RISK: "✅",
-        RiskLevel.EXCEPTION: "➖"
-    }
+    yield "\n" + "="*100
+    yield f"{_RISK_LEVEL_INDICATORS[result.risk_level]} CLASSIFICATION: {result.risk_level.value}"
+    yield f"Confidence: {result.confidence}"
+    yield "="*100
     
-    output.append("\n" + "="*100)
-    output.append(f"{indicators[result.risk_level]} CLASSIFICATION: {result.risk_level.value}")
-    output.append(f"Confidence: {result.confidence}")
-    output.append("="*100)
-    
-    output.append("\n💡 REASONING:")
+    yield "\n💡 REASONING:"
     for i, reason in enumerate(result.reasoning, 1):
-        output.append(f"  {i}. {reason}")
+        yield f"  {i}. {reason}"
     
-    output.append("\n📜 RELEVANT PROVISIONS:")
+    yield "\n📜 RELEVANT PROVISIONS:"
     for article in result.relevant_articles:
-        output.append(f"  • {article}")
+        yield f"  • {article}"
     
     if result.recommendations:
-        output.append("\n✅ COMPLIANCE RECOMMENDATIONS:")
+        yield "\n✅ COMPLIANCE RECOMMENDATIONS:"
         for i, rec in enumerate(result.recommendations[:5], 1):  # Top 5
-            output.append(f"  {i}. {rec}")
+            yield f"  {i}. {rec}"
         if len(result.recommendations) > 5:
-            output.append(f"  ... and {len(result.recommendations)-5} more")
-    
-    output.append("\n" + "="*100)
+            yield f"  ... and {len(result.recommendations)-5} more"
     
-    return "\n".join(output)
+    yield "\n" + "="*100
+
+def format_result(profile: AISystemProfile, result: ClassificationResult) -> str:
+    """Format results for display"""
+    return "\n".join(iter_result_lines(profile, result))
 
 # Example usage
 if __name__ == "__main__":
@@ -643,5 +886,6 @@ if __name__ == "__main__":
     classifier = RiskClassificationAgent()
     result = classifier.classify(profile)
 
-    # Display
-    safe_print(format_result(profile, result))
+    # Display, streaming the report line by line
+    for line in iter_result_lines(profile, result):
+        safe_print(line)
@@ -5,7 +5,7 @@ Deploy to Streamlit Cloud for instant web interface
 
 import streamlit as st
 import json
-from dataclasses import asdict
+from dataclasses import fields
 from datetime import datetime
 
 # Configure page
@@ -16,20 +16,95 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Import classifier components
+# Import classifier components on first use, so the page renders before the classifier loads
 # Note: These will be in the same directory when deployed
-try:
-    from ai_act_classifier_with_search import (
-        EnhancedInformationHarvestingAgent,
-        RiskClassificationAgent,
-        RiskLevel
+def _classifier_module():
+    try:
+        import ai_act_classifier_with_search
+    except ImportError:
+        st.error("⚠️ Classifier modules not found. Make sure all files are in the repository.")
+        st.stop()
+    return ai_act_classifier_with_search
+
+# Agents are built once per process and shared across reruns and sessions
+@st.cache_resource
+def get_harvester(enable_search: bool):
+    return _classifier_module().EnhancedInformationHarvestingAgent(enable_search=enable_search)
+
+@st.cache_resource
+def get_classifier():
+    return _classifier_module().RiskClassificationAgent()
+
+# Identical submissions are served from the cache instead of re-harvesting; classifying
+# a profile is pure and cheap, so it always runs on the profile at hand.
+# A search-enabled run where some queries failed (ddgs outage or rate limit) raises
+# out of the cached function so it is not stored, and is served uncached instead
+class _SearchIncomplete(Exception):
+    def __init__(self, value):
+        super().__init__("some web search queries failed")
+        self.value = value
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _harvest_cached(company: str, system_name: str, description: str, enable_search: bool):
+    profile = get_harvester(enable_search).harvest_from_description(
+        name=system_name,
+        company=company,
+        description=description
     )
-except ImportError:
-    st.error("⚠️ Classifier modules not found. Make sure all files are in the repository.")
-    st.stop()
+    if not profile.search_complete:
+        raise _SearchIncomplete(profile)
+    return profile
+
+def harvest_cached(company: str, system_name: str, description: str, enable_search: bool):
+    try:
+        return _harvest_cached(company, system_name, description, enable_search)
+    except _SearchIncomplete as e:
+        return e.value
+
+EXAMPLES = [
+    {
+        "name": "MBUX Virtual Assistant",
+        "company": "Mercedes-Benz",
+        "description": "An AI-powered virtual assistant that enables natural conversations with drivers, providing personalized answers for navigation and points of interest while the vehicle is in operation.",
+        "expected": "High-Risk (Safety component in vehicle)"
+    },
+    {
+        "name": "AI Recruitment Tool",
+        "company": "HireTech Inc",
+        "description": "An AI system that screens job applications, ranks candidates based on resume analysis, and recommends top candidates to hiring managers for interview selection.",
+        "expected": "High-Risk (Employment decisions)"
+    },
+    {
+        "name": "Customer Service Chatbot",
+        "company": "ShopEasy",
+        "description": "A conversational AI chatbot that helps customers find products, track orders, and answer frequently asked questions on our e-commerce website.",
+        "expected": "Transparency Requirements (Interactive AI)"
+    },
+    {
+        "name": "Medical Diagnosis Assistant",
+        "company": "MedAI Solutions",
+        "description": "An AI system that analyzes patient symptoms, medical history, and test results to suggest potential diagnoses and treatment options for physicians to review.",
+        "expected": "High-Risk (Medical decision support)"
+    },
+    {
+        "name": "Social Media Filter",
+        "company": "PhotoApp",
+        "description": "An AI-powered image filter that enhances photos, applies artistic effects, and removes blemishes for personal social media posts.",
+        "expected": "Low-Risk (Personal use)"
+    }
+]
+
+# The examples are fixed, so they are harvested as one batch and classified once per process
+@st.cache_resource(show_spinner=False)
+def precomputed_examples():
+    profiles = get_harvester(False).harvest_batch(
+        (example["name"], example["company"], example["description"]) for example in EXAMPLES
+    )
+    classifier = get_classifier()
+    return [(profile, classifier.classify(profile)) for profile in profiles]
 
 # Custom CSS for better styling
-st.markdown("""
+CSS_BLOCK = """
     <style>
     .main-header {
         font-size: 3rem;
@@ -69,8 +144,20 @@ st.markdown("""
         background-color: #f0f0f0;
         border-left: 5px solid #999999;
     }
+    .about-columns {
+        display: grid;
+        grid-template-columns: 1fr 1fr;
+        gap: 1rem;
+    }
+    @media (max-width: 640px) {
+        .about-columns {
+            grid-template-columns: 1fr;
+        }
+    }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(CSS_BLOCK, unsafe_allow_html=True)
 
 # Title and description
 st.markdown('<div class="main-header">EU AI Act Risk Classifier</div>', unsafe_allow_html=True)
@@ -78,8 +165,8 @@ st.markdown('<div class="sub-header">Classify your AI system according to the EU
 st.markdown('<div class="sub-header">The sweet irony of using AI to assess the risk of AI -- surely not what EU legislators intended! :-)</div>', unsafe_allow_html=True)
 st.markdown('<div class="sub-header">Demonstrator under development</div>', unsafe_allow_html=True)
 
-# Sidebar with information
-with st.sidebar:
+# Static page sections
+def render_sidebar():
     st.header("ℹ️ About")
     st.markdown("""
     This tool provides **preliminary risk classification** of AI systems according to the EU AI Act.
@@ -115,13 +202,249 @@ with st.sidebar:
     **Last Updated:** February 2026
     """)
 
-# Main content area
-st.markdown("---")
+# About tab and footer contain no dynamic data, so they are built once as plain HTML
+_ABOUT_HTML = """
+<h2>📖 About the EU AI Act</h2>
 
-# Create tabs
-tab1, tab2, tab3 = st.tabs(["🔍 Classify System", "📚 Examples", "📖 About the EU AI Act"])
+<p>
+The <strong>EU Artificial Intelligence Act</strong> (AI Act) is a comprehensive legal framework regulating
+AI systems in the European Union. It entered into force in 2024 and is the world's first
+comprehensive AI law.
+</p>
 
-with tab1:
+<h3>Risk-Based Approach</h3>
+
+<p>The AI Act uses a risk-based classification system:</p>
+
+<div class="about-columns">
+    <div>
+        <h4>🚫 Prohibited AI Systems</h4>
+        <p>Systems that pose unacceptable risks:</p>
+        <ul>
+            <li>Subliminal manipulation</li>
+            <li>Social scoring</li>
+            <li>Real-time biometric identification in public</li>
+            <li>Emotion recognition in workplace/schools (in most cases)</li>
+        </ul>
+
+        <h4>⚠️ High-Risk AI Systems</h4>
+        <p>Systems in sensitive areas:</p>
+        <ul>
+            <li>Critical infrastructure</li>
+            <li>Education and employment</li>
+            <li>Law enforcement</li>
+            <li>Border control</li>
+            <li>Justice administration</li>
+            <li>Essential services (credit scoring, etc.)</li>
+        </ul>
+    </div>
+    <div>
+        <h4>ℹ️ Transparency Requirements</h4>
+        <p>Systems requiring disclosure:</p>
+        <ul>
+            <li>Interactive AI (chatbots)</li>
+            <li>Generative AI</li>
+            <li>Emotion recognition systems</li>
+            <li>Deepfakes</li>
+        </ul>
+
+        <h4>✅ Low-Risk AI Systems</h4>
+        <p>Everything else:</p>
+        <ul>
+            <li>Voluntary codes of conduct</li>
+            <li>No mandatory requirements</li>
+            <li>Encouraged to self-regulate</li>
+        </ul>
+    </div>
+</div>
+
+<hr>
+
+<h3>Key Compliance Requirements for High-Risk Systems</h3>
+
+<p>High-risk AI systems must comply with:</p>
+
+<ol>
+    <li><strong>Risk Management</strong> (Article 9) - Continuous risk assessment and mitigation</li>
+    <li><strong>Data Governance</strong> (Article 10) - High-quality, unbiased training data</li>
+    <li><strong>Technical Documentation</strong> (Article 11) - Comprehensive system documentation</li>
+    <li><strong>Record-Keeping</strong> (Article 12) - Logging of system operations</li>
+    <li><strong>Transparency</strong> (Article 13) - Clear information to users</li>
+    <li><strong>Human Oversight</strong> (Article 14) - Meaningful human control</li>
+    <li><strong>Accuracy &amp; Robustness</strong> (Article 15) - High performance standards</li>
+    <li><strong>Conformity Assessment</strong> (Article 43) - Third-party evaluation</li>
+    <li><strong>EU Database Registration</strong> (Article 71) - Public registration</li>
+</ol>
+"""
+
+_FOOTER_HTML = """
+<div style='text-align: center; color: #666; padding: 2rem;'>
+    <p>EU AI Act Risk Classifier v1.0</p>
+    <p>⚠️ For informational purposes only. Not legal advice.</p>
+    <p>Built with ❤️ using Streamlit</p>
+</div>
+"""
+
+def render_about_tab():
+    st.html(_ABOUT_HTML)
+    
+    # Links stay in markdown, which opens them in a new tab; st.html strips target="_blank"
+    st.markdown("---")
+    
+    st.subheader("📚 Resources")
+    
+    st.markdown("""
+    - [Official EU AI Act Text](https://artificialintelligenceact.eu/)
+    - [European Commission AI Act Page](https://digital-strategy.ec.europa.eu/en/policies/regulatory-framework-ai)
+    - [AI Act Compliance Guide](https://artificialintelligenceact.eu/compliance/)
+    
+    **Disclaimer:** This tool provides preliminary guidance only. Always consult qualified 
+    legal professionals for compliance decisions.
+    """)
+
+# Result styling per RiskLevel member name
+_RISK_CSS_CLASS = {
+    "PROHIBITED": "prohibited",
+    "HIGH_RISK": "high-risk",
+    "TRANSPARENCY_REQUIREMENTS": "transparency",
+    "LOW_RISK": "low-risk",
+    "EXCEPTION": "exception"
+}
+
+_RISK_EMOJI = {
+    "PROHIBITED": "🚫",
+    "HIGH_RISK": "⚠️",
+    "TRANSPARENCY_REQUIREMENTS": "ℹ️",
+    "LOW_RISK": "✅",
+    "EXCEPTION": "➖"
+}
+
+def render_profile(profile):
+    st.subheader("📊 System Profile")
+    st.markdown(f"**Sector:** {profile.sector}")
+    st.markdown(f"**Deployment:** {profile.deployment_context}")
+    st.markdown(f"**User Base:** {profile.user_base}")
+    st.markdown(f"**Decision Role:** {profile.decision_making_role}")
+    
+    if profile.biometrics_involved:
+        st.markdown(f"**🔐 Biometrics:** Yes ({profile.biometrics_purpose})")
+    
+    if profile.high_risk_context:
+        st.markdown("**⚠️ High-Risk Contexts:**")
+        st.markdown("\n".join(f"- {ctx}" for ctx in profile.high_risk_context))
+
+# Display results
+@st.fragment
+def render_results(profile, result, system_name, company, description):
+    # Determine CSS class
+    css_class = _RISK_CSS_CLASS.get(result.risk_level.name, "low-risk")
+    
+    # Risk indicator
+    risk_emoji = _RISK_EMOJI.get(result.risk_level.name, "❓")
+    
+    # Display classification
+    st.markdown("---")
+    st.markdown(f'<div class="risk-box {css_class}">', unsafe_allow_html=True)
+    st.markdown(f"## {risk_emoji} Classification: {result.risk_level.value}")
+    st.markdown(f"**Confidence:** {result.confidence}")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Create columns for detailed results
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        render_profile(profile)
+    
+    with col2:
+        st.subheader("💡 Reasoning")
+        st.markdown("\n".join(f"{i}. {reason}" for i, reason in enumerate(result.reasoning, 1)))
+    
+    # Relevant provisions
+    st.subheader("📜 Relevant EU AI Act Provisions")
+    st.markdown("\n".join(f"- {article}" for article in result.relevant_articles))
+    
+    # Recommendations (if any)
+    if result.recommendations:
+        st.subheader("✅ Compliance Recommendations")
+        
+        # Show top 5 recommendations
+        st.markdown("\n".join(f"{i}. {rec}" for i, rec in enumerate(result.recommendations[:5], 1)))
+        
+        if len(result.recommendations) > 5:
+            with st.expander(f"View all {len(result.recommendations)} recommendations"):
+                st.markdown("\n".join(f"{i}. {rec}" for i, rec in enumerate(result.recommendations[5:], 6)))
+    
+    # Export options
+    st.markdown("---")
+    st.subheader("💾 Export Results")
+    
+    # Export payloads are only built when a download button is clicked
+    def build_json_export():
+        export_data = {
+            "timestamp": datetime.now().isoformat(),
+            "system": {
+                "name": system_name,
+                "company": company,
+                "description": description
+            },
+            "profile": {f.name: getattr(profile, f.name) for f in fields(profile) if f.init},
+            "classification": {
+                "risk_level": result.risk_level.value,
+                "confidence": result.confidence,
+                "reasoning": result.reasoning,
+                "relevant_articles": result.relevant_articles,
+                "recommendations": result.recommendations,
+                "decision_path": result.decision_path
+            }
+        }
+        return json.dumps(export_data, indent=2)
+    
+    def build_report():
+        return f"""EU AI ACT CLASSIFICATION REPORT
+{'='*80}
+
+System: {system_name}
+Company: {company}
+Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+CLASSIFICATION: {result.risk_level.value}
+Confidence: {result.confidence}
+
+REASONING:
+{chr(10).join(f'{i}. {r}' for i, r in enumerate(result.reasoning, 1))}
+
+RELEVANT PROVISIONS:
+{chr(10).join(f'- {a}' for a in result.relevant_articles)}
+
+RECOMMENDATIONS:
+{chr(10).join(f'{i}. {r}' for i, r in enumerate(result.recommendations, 1))}
+
+{'='*80}
+This is a preliminary assessment. Consult legal professionals for compliance.
+"""
+    
+    safe_name = system_name.strip().replace(' ', '_') or 'system'
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.download_button(
+            label="📥 Download JSON",
+            data=build_json_export,
+            file_name=f"{safe_name}_classification.json",
+            mime="application/json"
+        )
+    
+    with col2:
+        st.download_button(
+            label="📄 Download Report",
+            data=build_report,
+            file_name=f"{safe_name}_report.txt",
+            mime="text/plain"
+        )
+
+# Submitting the form reruns only this fragment, not the static sections around it
+@st.fragment
+def render_classifier_tab():
     st.header("Classify Your AI System")
     
     # Create form
@@ -167,169 +490,67 @@ with tab1:
     
     # Process form submission
     if submitted:
-        # Validation
+        # Validation; all problems are reported together in one message
+        errors = []
         if not company or not system_name or not description:
-            st.error("⚠️ Please fill in all required fields (marked with *)")
-        elif len(description) < 50:
-            st.warning("⚠️ Please provide a more detailed description (at least 50 characters)")
+            errors.append("⚠️ Please fill in all required fields (marked with *)")
+        if description and len(description) < 50:
+            errors.append("⚠️ Please provide a more detailed description (at least 50 characters)")
+        
+        if errors:
+            st.session_state.pop("last_result", None)
+            st.error("\n\n".join(errors))
         else:
-            # Show progress
-            with st.spinner("🔍 Analyzing your AI system..."):
+            # Show progress; the profile is shown as soon as harvesting returns
+            with st.status("🔍 Analyzing your AI system...", expanded=True) as status:
+                # Placeholder for the early profile; cleared once the full results take over
+                early_profile = st.empty()
                 try:
                     # Stage 1: Information Harvesting
-                    st.info("**Stage 1:** Harvesting information from description...")
-                    
-                    harvester = EnhancedInformationHarvestingAgent(enable_search=enable_search)
-                    profile = harvester.harvest_from_description(
-                        name=system_name,
-                        company=company,
-                        description=description
-                    )
+                    status.update(label="**Stage 1:** Harvesting information from description...")
+                    profile = harvest_cached(company, system_name, description, enable_search)
+                    with early_profile.container():
+                        render_profile(profile)
                     
                     # Stage 2: Risk Classification
-                    st.info("**Stage 2:** Applying EU AI Act classification logic...")
-                    
-                    classifier = RiskClassificationAgent()
-                    result = classifier.classify(profile)
-                    
-                    # Display results
-                    st.success("✅ Classification Complete!")
-                    
-                    # Determine CSS class
-                    css_class = {
-                        RiskLevel.PROHIBITED: "prohibited",
-                        RiskLevel.HIGH_RISK: "high-risk",
-                        RiskLevel.TRANSPARENCY_REQUIREMENTS: "transparency",
-                        RiskLevel.LOW_RISK: "low-risk",
-                        RiskLevel.EXCEPTION: "exception"
-                    }.get(result.risk_level, "low-risk")
-                    
-                    # Risk indicator
-                    risk_emoji = {
-                        RiskLevel.PROHIBITED: "🚫",
-                        RiskLevel.HIGH_RISK: "⚠️",
-                        RiskLevel.TRANSPARENCY_REQUIREMENTS: "ℹ️",
-                        RiskLevel.LOW_RISK: "✅",
-                        RiskLevel.EXCEPTION: "➖"
-                    }.get(result.risk_level, "❓")
-                    
-                    # Display classification
-                    st.markdown("---")
-                    st.markdown(f'<div class="risk-box {css_class}">', unsafe_allow_html=True)
-                    st.markdown(f"## {risk_emoji} Classification: {result.risk_level.value}")
-                    st.markdown(f"**Confidence:** {result.confidence}")
-                    st.markdown('</div>', unsafe_allow_html=True)
-                    
-                    # Create columns for detailed results
-                    col1, col2 = st.columns([1, 1])
+                    status.update(label="**Stage 2:** Applying EU AI Act classification logic...")
+                    result = get_classifier().classify(profile)
+                    st.session_state["last_result"] = (profile, result, system_name, company, description)
                     
-                    with col1:
-                        st.subheader("📊 System Profile")
-                        st.markdown(f"**Sector:** {profile.sector}")
-                        st.markdown(f"**Deployment:** {profile.deployment_context}")
-                        st.markdown(f"**User Base:** {profile.user_base}")
-                        st.markdown(f"**Decision Role:** {profile.decision_making_role}")
-                        
-                        if profile.biometrics_involved:
-                            st.markdown(f"**🔐 Biometrics:** Yes ({profile.biometrics_purpose})")
-                        
-                        if profile.high_risk_context:
-                            st.markdown("**⚠️ High-Risk Contexts:**")
-                            for ctx in profile.high_risk_context:
-                                st.markdown(f"- {ctx}")
-                    
-                    with col2:
-                        st.subheader("💡 Reasoning")
-                        for i, reason in enumerate(result.reasoning, 1):
-                            st.markdown(f"{i}. {reason}")
-                    
-                    # Relevant provisions
-                    st.subheader("📜 Relevant EU AI Act Provisions")
-                    for article in result.relevant_articles:
-                        st.markdown(f"- {article}")
-                    
-                    # Recommendations (if any)
-                    if result.recommendations:
-                        st.subheader("✅ Compliance Recommendations")
-                        
-                        # Show top 5 recommendations
-                        for i, rec in enumerate(result.recommendations[:5], 1):
-                            st.markdown(f"{i}. {rec}")
-                        
-                        if len(result.recommendations) > 5:
-                            with st.expander(f"View all {len(result.recommendations)} recommendations"):
-                                for i, rec in enumerate(result.recommendations[5:], 6):
-                                    st.markdown(f"{i}. {rec}")
-                    
-                    # Export options
-                    st.markdown("---")
-                    st.subheader("💾 Export Results")
-                    
-                    # Prepare JSON export
-                    export_data = {
-                        "timestamp": datetime.now().isoformat(),
-                        "system": {
-                            "name": system_name,
-                            "company": company,
-                            "description": description
-                        },
-                        "profile": asdict(profile),
-                        "classification": {
-                            "risk_level": result.risk_level.value,
-                            "confidence": result.confidence,
-                            "reasoning": result.reasoning,
-                            "relevant_articles": result.relevant_articles,
-                            "recommendations": result.recommendations,
-                            "decision_path": result.decision_path
-                        }
-                    }
-                    
-                    json_str = json.dumps(export_data, indent=2)
-                    
-                    col1, col2 = st.columns([1, 1])
-                    
-                    with col1:
-                        st.download_button(
-                            label="📥 Download JSON",
-                            data=json_str,
-                            file_name=f"{system_name.replace(' ', '_')}_classification.json",
-                            mime="application/json"
-                        )
-                    
-                    with col2:
-                        # Generate text report
-                        report = f"""EU AI ACT CLASSIFICATION REPORT
-{'='*80}
+                    early_profile.empty()
+                    status.update(label="✅ Classification Complete!", state="complete", expanded=False)
+                
+                except Exception as e:
+                    st.session_state.pop("last_result", None)
+                    status.update(label="❌ Classification failed", state="error")
+                    st.error(f"❌ Error during classification: {str(e)}")
+                    st.error("Please check your input and try again.")
+    
+    # Results of the last successful submission stay on screen across unrelated reruns
+    if "last_result" in st.session_state:
+        render_results(*st.session_state["last_result"])
 
-System: {system_name}
-Company: {company}
-Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
-CLASSIFICATION: {result.risk_level.value}
-Confidence: {result.confidence}
+with st.sidebar:
+    render_sidebar()
 
-REASONING:
-{chr(10).join(f'{i}. {r}' for i, r in enumerate(result.reasoning, 1))}
+# Main content area
+st.markdown("---")
 
-RELEVANT PROVISIONS:
-{chr(10).join(f'- {a}' for a in result.relevant_articles)}
+# Create tabs
+tab1, tab2, tab3 = st.tabs(["🔍 Classify System", "📚 Examples", "📖 About the EU AI Act"])
 
-RECOMMENDATIONS:
-{chr(10).join(f'{i}. {r}' for i, r in enumerate(result.recommendations, 1))}
+with tab1:
+    render_classifier_tab()
 
-{'='*80}
-This is a preliminary assessment. Consult legal professionals for compliance.
-"""
-                        st.download_button(
-                            label="📄 Download Report",
-                            data=report,
-                            file_name=f"{system_name.replace(' ', '_')}_report.txt",
-                            mime="text/plain"
-                        )
-                
-                except Exception as e:
-                    st.error(f"❌ Error during classification: {str(e)}")
-                    st.error("Please check your input and try again.")
+# The About tab and footer are filled first; the Examples tab needs the classifier
+# and is filled last, so the rest of the page does not wait for the import
+with tab3:
+    render_about_tab()
+
+# Footer
+st.markdown("---")
+st.html(_FOOTER_HTML)
 
 with tab2:
     st.header("📚 Example Use Cases")
@@ -338,134 +559,11 @@ with tab2:
     Click on any example to see how different AI systems are classified:
     """)
     
-    examples = [
-        {
-            "name": "MBUX Virtual Assistant",
-            "company": "Mercedes-Benz",
-            "description": "An AI-powered virtual assistant that enables natural conversations with drivers, providing personalized answers for navigation and points of interest while the vehicle is in operation.",
-            "expected": "High-Risk (Safety component in vehicle)"
-        },
-        {
-            "name": "AI Recruitment Tool",
-            "company": "HireTech Inc",
-            "description": "An AI system that screens job applications, ranks candidates based on resume analysis, and recommends top candidates to hiring managers for interview selection.",
-            "expected": "High-Risk (Employment decisions)"
-        },
-        {
-            "name": "Customer Service Chatbot",
-            "company": "ShopEasy",
-            "description": "A conversational AI chatbot that helps customers find products, track orders, and answer frequently asked questions on our e-commerce website.",
-            "expected": "Transparency Requirements (Interactive AI)"
-        },
-        {
-            "name": "Medical Diagnosis Assistant",
-            "company": "MedAI Solutions",
-            "description": "An AI system that analyzes patient symptoms, medical history, and test results to suggest potential diagnoses and treatment options for physicians to review.",
-            "expected": "High-Risk (Medical decision support)"
-        },
-        {
-            "name": "Social Media Filter",
-            "company": "PhotoApp",
-            "description": "An AI-powered image filter that enhances photos, applies artistic effects, and removes blemishes for personal social media posts.",
-            "expected": "Low-Risk (Personal use)"
-        }
-    ]
-    
-    for i, example in enumerate(examples):
+    for i, (example, (_, example_result)) in enumerate(zip(EXAMPLES, precomputed_examples())):
         with st.expander(f"**{example['name']}** - {example['company']}"):
             st.markdown(f"**Description:** {example['description']}")
             st.markdown(f"**Expected Classification:** {example['expected']}")
+            st.markdown(f"**Classifier Verdict:** {example_result.risk_level.value}")
             
             if st.button(f"Try this example", key=f"example_{i}"):
                 st.info("Copy the details above and paste into the 'Classify System' tab!")
-
-with tab3:
-    st.header("📖 About the EU AI Act")
-    
-    st.markdown("""
-    The **EU Artificial Intelligence Act** (AI Act) is a comprehensive legal framework regulating 
-    AI systems in the European Union. It entered into force in 2024 and is the world's first 
-    comprehensive AI law.
-    
-    ### Risk-Based Approach
-    
-    The AI Act uses a risk-based classification system:
-    """)
-    
-    col1, col2 = st.columns([1, 1])
-    
-    with col1:
-        st.markdown("""
-        #### 🚫 Prohibited AI Systems
-        Systems that pose unacceptable risks:
-        - Subliminal manipulation
-        - Social scoring
-        - Real-time biometric identification in public
-        - Emotion recognition in workplace/schools (in most cases)
-        
-        #### ⚠️ High-Risk AI Systems
-        Systems in sensitive areas:
-        - Critical infrastructure
-        - Education and employment
-        - Law enforcement
-        - Border control
-        - Justice administration
-        - Essential services (credit scoring, etc.)
-        """)
-    
-    with col2:
-        st.markdown("""
-        #### ℹ️ Transparency Requirements
-        Systems requiring disclosure:
-        - Interactive AI (chatbots)
-        - Generative AI
-        - Emotion recognition systems
-        - Deepfakes
-        
-        #### ✅ Low-Risk AI Systems
-        Everything else:
-        - Voluntary codes of conduct
-        - No mandatory requirements
-        - Encouraged to self-regulate
-        """)
-    
-    st.markdown("---")
-    
-    st.subheader("Key Compliance Requirements for High-Risk Systems")
-    
-    st.markdown("""
-    High-risk AI systems must comply with:
-    
-    1. **Risk Management** (Article 9) - Continuous risk assessment and mitigation
-    2. **Data Governance** (Article 10) - High-quality, unbiased training data
-    3. **Technical Documentation** (Article 11) - Comprehensive system documentation
-    4. **Record-Keeping** (Article 12) - Logging of system operations
-    5. **Transparency** (Article 13) - Clear information to users
-    6. **Human Oversight** (Article 14) - Meaningful human control
-    7. **Accuracy & Robustness** (Article 15) - High performance standards
-    8. **Conformity Assessment** (Article 43) - Third-party evaluation
-    9. **EU Database Registration** (Article 71) - Public registration
-    """)
-    
-    st.markdown("---")
-    
-    st.subheader("📚 Resources")
-    
-    st.markdown("""
-    - [Official EU AI Act Text](https://artificialintelligenceact.eu/)
-    - [European Commission AI Act Page](https://digital-strategy.ec.europa.eu/en/policies/regulatory-framework-ai)
-    - [AI Act Compliance Guide](https://artificialintelligenceact.eu/compliance/)
-    
-    **Disclaimer:** This tool provides preliminary guidance only. Always consult qualified 
-    legal professionals for compliance decisions.
-    """)
-
-# Footer
-st.markdown("---")
-st.markdown("""
-<div style='text-align: center; color: #666; padding: 2rem;'>
-    <p>EU AI Act Risk Classifier v1.0</p>
-    <p>⚠️ For informational purposes only. Not legal advice.</p>
-    <p>Built with ❤️ using Streamlit</p>
-</div>
-""", unsafe_allow_html=True)